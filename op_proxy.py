@@ -4,21 +4,39 @@ One Piece TCG Proxy Printer - Fetch and format One Piece cards for printing.
 """
 
 import argparse
+import atexit
+import hashlib
+import io
+import json
 import os
 import re
 import sys
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
+# Optional: libvips resizes noticeably faster than Pillow when available
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 # Constants
 CARD_WIDTH_INCHES = 2.5
 CARD_HEIGHT_INCHES = 3.5
@@ -27,11 +45,33 @@ CARDS_PER_ROW = 3
 CARDS_PER_COL = 3
 CARDS_PER_PAGE = CARDS_PER_ROW * CARDS_PER_COL
 
+# Concurrency
+MAX_WORKERS = 8  # Cards fetched in parallel
+MAX_SOURCE_WORKERS = 16  # Fallback source lookups in flight across all cards
+MAX_REQUESTS_PER_HOST = 4  # Concurrent requests allowed against a single host
+HOST_REQUESTS_PER_SECOND = 5  # Sustained request rate allowed against a single host
+HOST_REQUEST_BURST = 5  # Requests a host may receive back-to-back before throttling
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Image file extensions we can read, in cache lookup order
+_IMAGE_EXTS = ('.webp', '.png', '.jpg', '.jpeg')
+
+# Precompiled patterns
+_CARD_ENTRY_RE = re.compile(r'^(\d+)x?\s*(.+)$', re.IGNORECASE)
+_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
 # Cache directory
 CACHE_DIR = Path(__file__).parent / "cache"
 
+# Resolved image URLs persisted between runs
+URL_CACHE_PATH = CACHE_DIR / "urls.json"
+URL_CACHE_TTL = 30 * 24 * 60 * 60  # Re-validate entries older than 30 days
+
 # Custom images directory (for user-provided clean scans)
 CUSTOM_IMAGES_DIR = None  # Set via --image-dir
+_LOCAL_INDEX = None  # Built from CUSTOM_IMAGES_DIR on first lookup
+_LOCAL_INDEX_DIR = None
+_LOCAL_INDEX_LOCK = threading.Lock()
 
 # Request headers
 HEADERS = {
@@ -40,41 +80,103 @@ HEADERS = {
     'Accept-Language': 'en-US,en;q=0.5',
 }
 
+# Shared HTTP session - keeps connections alive across cards and sources
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# Shared pool for querying fallback sources in parallel (separate from the
+# per-card pool in main() so card workers can block on it without deadlocking)
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=MAX_SOURCE_WORKERS)
+
+# Card data resolved during this run, keyed by (normalized identifier, lang)
+_FETCH_CACHE = {}
+_FETCH_CACHE_LOCK = threading.Lock()
+
+# Image URLs resolved on previous runs, keyed by "<lang>:<normalized identifier>"
+_URL_CACHE = {}
+_URL_CACHE_DIRTY = False
+_URL_CACHE_LOCK = threading.Lock()
+
+# Per-host request slots and rate limits (keep each site polite while
+# different hosts run in parallel; cache hits never touch these)
+_HOST_SLOTS = defaultdict(lambda: threading.Semaphore(MAX_REQUESTS_PER_HOST))
+_HOST_NEXT_REQUEST = {}  # host -> time its token bucket is next full enough
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _wait_for_host_token(host: str):
+    """Block until the host's token bucket allows another request."""
+    interval = 1 / HOST_REQUESTS_PER_SECOND
+    with _HOST_SLOTS_LOCK:
+        now = time.monotonic()
+        next_request = max(_HOST_NEXT_REQUEST.get(host, now), now)
+        start = max(now, next_request - (HOST_REQUEST_BURST - 1) * interval)
+        _HOST_NEXT_REQUEST[host] = next_request + interval
+    if start > now:
+        time.sleep(start - now)
+
+
+@contextmanager
+def _host_slot(url: str):
+    """Hold one of the request slots for the URL's host, respecting its rate limit."""
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS[host]
+    with slot:
+        _wait_for_host_token(host)
+        yield
+
+
+def _http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session, limited per host."""
+    with _host_slot(url):
+        return SESSION.get(url, **kwargs)
+
+
+def _http_head(url: str, **kwargs) -> requests.Response:
+    """HEAD through the shared session, limited per host."""
+    with _host_slot(url):
+        return SESSION.head(url, **kwargs)
+
 
 def setup_cache():
     """Create cache directory if it doesn't exist."""
     CACHE_DIR.mkdir(exist_ok=True)
 
 
+def _local_image_index() -> dict:
+    """Map upper-cased file stems in CUSTOM_IMAGES_DIR to image paths, scanning the folder once."""
+    global _LOCAL_INDEX, _LOCAL_INDEX_DIR
+    with _LOCAL_INDEX_LOCK:
+        if _LOCAL_INDEX is None or _LOCAL_INDEX_DIR != CUSTOM_IMAGES_DIR:
+            index = {}
+            img_dir = Path(CUSTOM_IMAGES_DIR)
+            if img_dir.is_dir():
+                for path in sorted(img_dir.iterdir()):
+                    if path.suffix.lower() in _IMAGE_EXTS:
+                        index.setdefault(path.stem.upper(), path)
+            _LOCAL_INDEX, _LOCAL_INDEX_DIR = index, CUSTOM_IMAGES_DIR
+        return _LOCAL_INDEX
+
+
 def find_local_image(identifier: str) -> Optional[Path]:
     """Look for a local image file matching the card identifier."""
     if not CUSTOM_IMAGES_DIR:
         return None
     
-    img_dir = Path(CUSTOM_IMAGES_DIR)
-    if not img_dir.exists():
-        return None
-    
-    # Try various filename patterns
-    card_id = identifier.upper()
-    patterns = [
-        f"{card_id}.*",
-        f"{card_id.lower()}.*",
-        f"{sanitize_filename(identifier)}.*",
-    ]
-    
-    for pattern in patterns:
-        matches = list(img_dir.glob(pattern))
-        for match in matches:
-            if match.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp'):
-                return match
-    
-    return None
+    # Match by card ID or by sanitized card name, ignoring case
+    index = _local_image_index()
+    return index.get(identifier.upper()) or index.get(sanitize_filename(identifier).upper())
 
 
 def sanitize_filename(name: str) -> str:
     """Convert card name to safe filename."""
-    return re.sub(r'[<>:"/\\|?*]', '_', name.lower().replace(' ', '_'))
+    return _FILENAME_RE.sub('_', name.lower().replace(' ', '_'))
 
 
 def parse_card_entry(entry: str) -> Tuple[str, int]:
@@ -84,7 +186,7 @@ def parse_card_entry(entry: str) -> Tuple[str, int]:
         return None, 0
     
     # Match patterns like "4x Card Name", "4 OP01-001", or just "Card Name"
-    match = re.match(r'^(\d+)x?\s*(.+)$', entry, re.IGNORECASE)
+    match = _CARD_ENTRY_RE.match(entry)
     if match:
         quantity = int(match.group(1))
         identifier = match.group(2).strip()
@@ -95,9 +197,31 @@ def parse_card_entry(entry: str) -> Tuple[str, int]:
     return identifier, quantity
 
 
+def parse_card_id(identifier: str) -> Optional[Tuple[str, str]]:
+    """Split a card ID into (card_id, set_code), e.g. 'op01-001' -> ('OP01-001', 'OP01').
+    
+    Returns None if the identifier is not a card ID: 2-3 letters and a
+    2-digit set number, a dash, then 3 digits and an optional letter.
+    """
+    card_id = identifier.upper()
+    dash = card_id.find('-')
+    if dash not in (4, 5):
+        return None
+    
+    letters, set_number, number = card_id[:dash - 2], card_id[dash - 2:dash], card_id[dash + 1:]
+    if not (letters.isascii() and letters.isalpha() and set_number.isdecimal()):
+        return None
+    if len(number) not in (3, 4) or not number[:3].isdecimal():
+        return None
+    if len(number) == 4 and not (number[3].isascii() and number[3].isalpha()):
+        return None
+    
+    return card_id, card_id[:dash]
+
+
 def is_card_id(identifier: str) -> bool:
     """Check if identifier looks like a card ID (e.g., OP01-001, ST01-012)."""
-    return bool(re.match(r'^[A-Z]{2,3}\d{2}-\d{3}[A-Z]?$', identifier.upper()))
+    return parse_card_id(identifier) is not None
 
 
 def search_card_tcgplayer(identifier: str) -> Optional[dict]:
@@ -106,9 +230,9 @@ def search_card_tcgplayer(identifier: str) -> Optional[dict]:
         search_term = quote(f"One Piece {identifier}")
         search_url = f"https://www.tcgplayer.com/search/one-piece-card-game/product?q={search_term}"
         
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
+        response = _http_get(search_url, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             # Look for product image
             img = soup.select_one('img.product-image__image, img[data-testid="product-image"]')
             if img:
@@ -120,21 +244,19 @@ def search_card_tcgplayer(identifier: str) -> Optional[dict]:
         return None
 
 
-def search_card_official(identifier: str) -> Optional[dict]:
+def search_card_official(identifier: str, card_id: Optional[str]) -> Optional[dict]:
     """Search on official One Piece card game site."""
     try:
         # The official site uses this card search structure
-        card_id = identifier.upper() if is_card_id(identifier) else None
-        
         if card_id:
             # Direct card page URL pattern
             search_url = f"https://en.onepiece-cardgame.com/cardlist/?series={card_id[:4]}"
         else:
             search_url = f"https://en.onepiece-cardgame.com/cardlist/?freewords={quote(identifier)}"
         
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
+        response = _http_get(search_url, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for card images on the page
             cards = soup.select('div.resultCol a img, .cardImg img, img[data-src*="card"]')
@@ -152,19 +274,19 @@ def search_card_official(identifier: str) -> Optional[dict]:
         return None
 
 
-def search_card_onepiecetopdecks(identifier: str) -> Optional[dict]:
+def search_card_onepiecetopdecks(identifier: str, card_id: Optional[str]) -> Optional[dict]:
     """Search using One Piece Top Decks database."""
     try:
         # This site has a good card database
-        if is_card_id(identifier):
+        if card_id:
             # Format: OP01-001 -> search directly
-            search_url = f"https://onepiecetopdecks.com/card/{identifier.upper()}/"
+            search_url = f"https://onepiecetopdecks.com/card/{card_id}/"
         else:
             search_url = f"https://onepiecetopdecks.com/?s={quote(identifier)}&post_type=card"
         
-        response = requests.get(search_url, headers=HEADERS, timeout=15, allow_redirects=True)
+        response = _http_get(search_url, timeout=15, allow_redirects=True)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for card images
             img = soup.select_one('img.card-image, .card-img img, article img[src*="card"], .wp-post-image')
@@ -177,14 +299,14 @@ def search_card_onepiecetopdecks(identifier: str) -> Optional[dict]:
         return None
 
 
-def search_card_limitless(identifier: str) -> Optional[dict]:
+def search_card_limitless(identifier: str, card_id: Optional[str]) -> Optional[dict]:
     """Search using Limitless TCG."""
     try:
-        search_url = f"https://onepiece.limitlesstcg.com/cards/{identifier.upper()}" if is_card_id(identifier) else f"https://onepiece.limitlesstcg.com/cards?q={quote(identifier)}"
+        search_url = f"https://onepiece.limitlesstcg.com/cards/{card_id}" if card_id else f"https://onepiece.limitlesstcg.com/cards?q={quote(identifier)}"
         
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
+        response = _http_get(search_url, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for card image
             img = soup.select_one('img.card, .card-image img, img[src*="/cards/"]')
@@ -198,47 +320,31 @@ def search_card_limitless(identifier: str) -> Optional[dict]:
         return None
 
 
-def search_card_direct_cdn(identifier: str) -> Optional[dict]:
-    """Try direct CDN URLs for clean card images (no watermarks)."""
-    if not is_card_id(identifier):
-        return None
-    
-    card_id = identifier.upper()
-    # Extract set code (e.g., OP01 from OP01-001)
-    set_code = card_id.split('-')[0] if '-' in card_id else card_id[:4]
-    
-    return {'name': identifier, 'card_id': card_id, 'set_code': set_code}
-
-
-def search_card_limitless_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
+def search_card_limitless_cdn(identifier: str, card_id: Optional[str], set_code: Optional[str],
+                              lang: str = "EN") -> Optional[dict]:
     """Get card from Limitless TCG CDN - high quality scans."""
-    if not is_card_id(identifier):
+    if not card_id:
         return None
     
-    card_id = identifier.upper()
-    set_code = card_id.split('-')[0] if '-' in card_id else card_id[:4]
-    
     # Limitless CDN pattern: /one-piece/OP01/OP01-001_EN.webp
     url = f"https://limitlesstcg.nyc3.digitaloceanspaces.com/one-piece/{set_code}/{card_id}_{lang}.webp"
     
     try:
-        response = requests.head(url, headers=HEADERS, timeout=5)
+        response = _http_head(url, timeout=5)
         if response.status_code == 200:
-            return {'name': identifier, 'image_url': url}
+            return {'name': identifier, 'image_url': url, 'etag': response.headers.get('ETag')}
     except Exception:
         pass
     
     return None
 
 
-def search_card_direct_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
+def search_card_direct_cdn(identifier: str, card_id: Optional[str], lang: str = "EN") -> Optional[dict]:
     """Try direct CDN URLs for card images.
     Note: Official Bandai CDN images have SAMPLE watermarks."""
-    if not is_card_id(identifier):
+    if not card_id:
         return None
     
-    card_id = identifier.upper()
-    
     # These sources may have SAMPLE watermarks but are fallbacks
     if lang == "JP":
         cdn_urls = [
@@ -251,24 +357,23 @@ def search_card_direct_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
     
     for url in cdn_urls:
         try:
-            response = requests.head(url, headers=HEADERS, timeout=5)
+            response = _http_head(url, timeout=5)
             if response.status_code == 200:
-                return {'name': identifier, 'image_url': url}
+                return {'name': identifier, 'image_url': url, 'etag': response.headers.get('ETag')}
         except Exception:
             continue
     
     return None
 
 
-def search_card_opcgdb(identifier: str) -> Optional[dict]:
+def search_card_opcgdb(identifier: str, card_id: Optional[str]) -> Optional[dict]:
     """Search using opcgdb.com - community database with clean images."""
     try:
-        card_id = identifier.upper() if is_card_id(identifier) else identifier
-        search_url = f"https://opcgdb.com/cards/{card_id}"
+        search_url = f"https://opcgdb.com/cards/{card_id or identifier}"
         
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
+        response = _http_get(search_url, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for the main card image
             img = soup.select_one('img.card-image, .card img, img[alt*="card"], img[src*="/cards/"]')
@@ -282,7 +387,125 @@ def search_card_opcgdb(identifier: str) -> Optional[dict]:
         return None
 
 
-def fetch_card_data(identifier: str, verbose: bool = False, lang: str = "EN") -> Optional[dict]:
+def load_url_cache():
+    """Load image URLs resolved on previous runs and save them again at exit."""
+    global _URL_CACHE
+    try:
+        with open(URL_CACHE_PATH, 'r', encoding='utf-8') as f:
+            _URL_CACHE = json.load(f)
+    except (OSError, ValueError):
+        _URL_CACHE = {}
+    atexit.register(save_url_cache)
+
+
+def save_url_cache():
+    """Write the resolved image URLs to disk if anything changed."""
+    global _URL_CACHE_DIRTY
+    with _URL_CACHE_LOCK:
+        if not _URL_CACHE_DIRTY:
+            return
+        data = dict(_URL_CACHE)
+        _URL_CACHE_DIRTY = False
+    
+    temp_path = URL_CACHE_PATH.with_suffix('.tmp')
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        temp_path.replace(URL_CACHE_PATH)
+    except OSError as e:
+        print(f"  âš  Could not save URL cache: {e}")
+
+
+def lookup_url_cache(key: str) -> Optional[dict]:
+    """Return the cached card data for key, re-validating entries past their TTL."""
+    global _URL_CACHE_DIRTY
+    with _URL_CACHE_LOCK:
+        entry = _URL_CACHE.get(key)
+    if not entry:
+        return None
+    
+    if time.time() - entry.get('validated', 0) > URL_CACHE_TTL:
+        # Stale - a cheap HEAD (conditional on the ETag) tells us if it still exists
+        headers = {'If-None-Match': entry['etag']} if entry.get('etag') else {}
+        try:
+            response = _http_head(entry['image_url'], timeout=5, allow_redirects=True, headers=headers)
+            valid = response.status_code in (200, 304)
+        except Exception:
+            valid = False
+        
+        if not valid:
+            with _URL_CACHE_LOCK:
+                _URL_CACHE.pop(key, None)
+                _URL_CACHE_DIRTY = True
+            return None
+        
+        entry = dict(entry, validated=time.time(), etag=response.headers.get('ETag', entry.get('etag')))
+        with _URL_CACHE_LOCK:
+            _URL_CACHE[key] = entry
+            _URL_CACHE_DIRTY = True
+    
+    return {'name': entry['name'], 'image_url': entry['image_url'], 'source': entry['source'],
+            'cached': True}
+
+
+def store_url_cache(key: str, card: dict):
+    """Remember a resolved image URL for later runs.
+    
+    Sources that probe the image itself (the CDNs) pass along its ETag; for
+    scraped pages it is picked up on the first revalidation.
+    """
+    global _URL_CACHE_DIRTY
+    if not card.get('image_url'):
+        return
+    with _URL_CACHE_LOCK:
+        _URL_CACHE[key] = {
+            'name': card.get('name'),
+            'image_url': card['image_url'],
+            'source': card.get('source', ''),
+            'etag': card.get('etag'),
+            'validated': time.time(),
+        }
+        _URL_CACHE_DIRTY = True
+
+
+def forget_url_cache(key: str):
+    """Drop a cached image URL that no longer downloads."""
+    global _URL_CACHE_DIRTY
+    with _URL_CACHE_LOCK:
+        if _URL_CACHE.pop(key, None) is not None:
+            _URL_CACHE_DIRTY = True
+
+
+def url_cache_key(identifier: str, lang: str) -> str:
+    """Key for a card's entry in the URL cache."""
+    return f"{lang}:{card_key(identifier)}"
+
+
+def card_key(identifier: str) -> str:
+    """Normalize an identifier so equivalent spellings of a card match.
+    
+    Names use the same key as their downloaded image file, so two spellings
+    that would share a cache file are never fetched at the same time.
+    """
+    parsed = parse_card_id(identifier)
+    return parsed[0] if parsed else sanitize_filename(identifier)
+
+
+def fetch_card_data(identifier: str, lang: str = "EN") -> Optional[dict]:
+    """Fetch card data, reusing results already resolved during this run."""
+    key = (card_key(identifier), lang)
+    with _FETCH_CACHE_LOCK:
+        if key in _FETCH_CACHE:
+            card = _FETCH_CACHE[key]
+            return dict(card) if card else None
+    
+    card = search_card_sources(identifier, lang=lang)
+    with _FETCH_CACHE_LOCK:
+        _FETCH_CACHE[key] = card
+    return dict(card) if card else None
+
+
+def search_card_sources(identifier: str, lang: str = "EN") -> Optional[dict]:
     """Fetch card data from available sources.
     
     Source priority:
@@ -294,40 +517,71 @@ def fetch_card_data(identifier: str, verbose: bool = False, lang: str = "EN") ->
     # Check for local image first
     local_path = find_local_image(identifier)
     if local_path:
-        if verbose:
-            print(f"    Source: Local image ({local_path.name})")
         return {'name': identifier, 'local_path': str(local_path), 'source': 'Local'}
     
+    # Reuse an image URL resolved on a previous run
+    key = url_cache_key(identifier, lang)
+    card = lookup_url_cache(key)
+    if card:
+        return card
+    
+    card = search_remote_sources(identifier, lang=lang)
+    if card:
+        store_url_cache(key, card)
+    return card
+
+
+def search_remote_sources(identifier: str, lang: str = "EN") -> Optional[dict]:
+    """Search the online sources in priority order."""
+    # Parse the card ID once and share it with every source
+    card_id, set_code = parse_card_id(identifier) or (None, None)
+    
     # Try Limitless CDN - these are actual card scans
-    card = search_card_limitless_cdn(identifier, lang)
+    card = search_card_limitless_cdn(identifier, card_id, set_code, lang)
     if card and card.get('image_url'):
         card['source'] = "Limitless CDN"
-        if verbose:
-            print(f"    Source: Limitless CDN ({lang})")
         return card
     
-    # Fallback sources (may have watermarks)
+    # Fallback sources (may have watermarks), queried in parallel -
+    # the highest-priority source that finds the card wins
     fallback_sources = [
-        ("OPCGDB", lambda x: search_card_opcgdb(x)),
-        ("Limitless Site", lambda x: search_card_limitless(x)),
-        ("Top Decks", lambda x: search_card_onepiecetopdecks(x)),
-        ("Official Site", lambda x: search_card_official(x)),
-        ("Official CDN", lambda x: search_card_direct_cdn(x, lang)),
+        ("OPCGDB", lambda x: search_card_opcgdb(x, card_id)),
+        ("Limitless Site", lambda x: search_card_limitless(x, card_id)),
+        ("Top Decks", lambda x: search_card_onepiecetopdecks(x, card_id)),
+        ("Official Site", lambda x: search_card_official(x, card_id)),
+        ("Official CDN", lambda x: search_card_direct_cdn(x, card_id, lang)),
         ("TCGPlayer", lambda x: search_card_tcgplayer(x)),
     ]
     
-    for source_name, search_func in fallback_sources:
-        card = search_func(identifier)
-        if card and card.get('image_url'):
-            card['source'] = source_name
-            if verbose:
-                print(f"    Source: {source_name} (may have SAMPLE watermark)")
-            return card
+    futures = [(source_name, _SOURCE_POOL.submit(search_func, identifier))
+               for source_name, search_func in fallback_sources]
+    try:
+        for source_name, future in futures:
+            card = future.result()
+            if card and card.get('image_url'):
+                card['source'] = source_name
+                return card
+    finally:
+        # Lower-priority lookups that haven't started yet are no longer needed
+        for _, future in futures:
+            future.cancel()
     
     print(f"  âš  Card not found: {identifier}")
     return None
 
 
+def describe_source(card_data: dict, lang: str = "EN") -> str:
+    """Say where a card's image came from, for --verbose output."""
+    source = card_data.get('source', '')
+    if 'local_path' in card_data:
+        return f"Local image ({Path(card_data['local_path']).name})"
+    if card_data.get('cached'):
+        return f"{source} (cached URL)"
+    if source == "Limitless CDN":
+        return f"Limitless CDN ({lang})"
+    return f"{source} (may have SAMPLE watermark)"
+
+
 def get_image_url(card_data: dict) -> Optional[str]:
     """Extract image URL from card data."""
     # Check various possible fields
@@ -341,42 +595,150 @@ def get_image_url(card_data: dict) -> Optional[str]:
     return None
 
 
+def image_extension(content_type: str, url: str) -> str:
+    """Pick a file extension for a downloaded image from its Content-Type or URL."""
+    content_type = content_type.lower()
+    if 'webp' in content_type:
+        return '.webp'
+    if 'png' in content_type:
+        return '.png'
+    if 'jpeg' in content_type or 'jpg' in content_type:
+        return '.jpg'
+    
+    suffix = Path(urlparse(url).path).suffix.lower()
+    return suffix if suffix in _IMAGE_EXTS else '.png'
+
+
+def save_response(response: requests.Response, path: Path):
+    """Stream a response body to path.
+    
+    The body goes to a .part file that only replaces path once complete, so an
+    interrupted download never leaves a truncated image in the cache.
+    """
+    temp_path = path.with_name(path.name + '.part')
+    try:
+        with open(temp_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+        temp_path.replace(path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
 def download_image(url: str, card_name: str, use_cache: bool = True) -> Optional[Path]:
-    """Download card image and return local path."""
-    filename = sanitize_filename(card_name) + ".png"
-    cache_path = CACHE_DIR / filename
+    """Download card image and return local path.
+    
+    The file keeps the source's format (e.g. Limitless CDN images stay WebP).
+    """
+    stem = sanitize_filename(card_name)
     
     # Check cache first
-    if use_cache and cache_path.exists():
-        return cache_path
+    if use_cache:
+        for ext in _IMAGE_EXTS:
+            cache_path = CACHE_DIR / f"{stem}{ext}"
+            if cache_path.exists():
+                return cache_path
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        # Stream to disk so only one chunk per download is held in memory
+        with _host_slot(url), SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Some sites answer missing images with an HTML page and a 200
+            content_type = response.headers.get('Content-Type', '')
+            if not content_type.startswith('image/'):
+                print(f"  âš  Unexpected content type for '{card_name}': {content_type or 'unknown'}")
+                return None
+            
+            cache_path = CACHE_DIR / f"{stem}{image_extension(content_type, url)}"
+            save_response(response, cache_path)
         
-        with open(cache_path, 'wb') as f:
-            f.write(response.content)
+        # Drop copies of this card cached earlier in another format
+        for ext in _IMAGE_EXTS:
+            if ext != cache_path.suffix:
+                (CACHE_DIR / f"{stem}{ext}").unlink(missing_ok=True)
         
         return cache_path
     except requests.exceptions.RequestException as e:
-        print(f"  âš  Failed to download image for '{card_name}': {e}")
+        print(f"  âš  Failed to download image for '{card_name}': {e}")
         return None
 
 
-def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
-    """Resize card image to standard TCG dimensions at specified DPI."""
+def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI, use_cache: bool = True) -> Image.Image:
+    """Resize card image to standard TCG dimensions at specified DPI.
+    
+    Uses libvips (pyvips) when installed and falls back to Pillow. Resized
+    images are cached next to the downloaded ones as <name>-<hash>@<dpi>.jpg,
+    where the hash covers the source's full path, and reused while they are
+    newer than their source image.
+    """
     target_width = int(CARD_WIDTH_INCHES * dpi)
     target_height = int(CARD_HEIGHT_INCHES * dpi)
     
+    # A custom scan and a downloaded image can share a name (or differ only in
+    # case), so key on the source's full path
+    source_hash = hashlib.md5(str(image_path.resolve()).encode('utf-8')).hexdigest()[:8]
+    resized_path = CACHE_DIR / f"{image_path.stem}-{source_hash}@{dpi}.jpg"
+    if (use_cache and resized_path.exists()
+            and resized_path.stat().st_mtime >= image_path.stat().st_mtime):
+        return Image.open(resized_path)
+    
+    img = None
+    if pyvips is not None:
+        try:
+            img = _resize_with_vips(image_path, target_width, target_height)
+        except pyvips.Error:
+            img = None  # Format libvips can't handle - use Pillow instead
+    if img is None:
+        img = _resize_with_pillow(image_path, target_width, target_height)
+    
+    if use_cache:
+        # Written under a temp name so an interrupted save can't leave a
+        # truncated file that passes the mtime check on later runs
+        temp_path = resized_path.with_name(resized_path.name + '.part')
+        try:
+            img.save(temp_path, "JPEG", quality=95, optimize=True)
+            temp_path.replace(resized_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        # Hand back the file so create_pdf embeds this JPEG instead of encoding again
+        return Image.open(resized_path)
+    
+    return img
+
+
+def _resize_with_vips(image_path: Path, target_width: int, target_height: int) -> Image.Image:
+    """Decode, resize and center-crop in a single libvips pipeline."""
+    vimg = pyvips.Image.thumbnail(str(image_path), target_width,
+                                  height=target_height, crop="centre")
+    if vimg.interpretation != "srgb":
+        vimg = vimg.colourspace("srgb")
+    if vimg.hasalpha():
+        vimg = vimg.flatten(background=[255, 255, 255])
+    vimg = vimg.cast("uchar")
+    return Image.frombytes('RGB', (vimg.width, vimg.height), vimg.write_to_memory())
+
+
+def _resize_with_pillow(image_path: Path, target_width: int, target_height: int) -> Image.Image:
+    """Resize and center-crop with Pillow's LANCZOS filter."""
     img = Image.open(image_path)
     
+    # Let libjpeg decode at a reduced scale that still covers the target size
+    if img.format == "JPEG":
+        img.draft("RGB", (target_width, target_height))
+    
     # Convert to RGB if necessary (for PNG with transparency)
-    if img.mode in ('RGBA', 'P'):
-        background = Image.new('RGB', img.size, (255, 255, 255))
-        if img.mode == 'P':
-            img = img.convert('RGBA')
-        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-        img = background
+    if img.mode == 'P':
+        img = img.convert('RGBA')
+    if img.mode == 'RGBA':
+        alpha = img.getchannel('A')
+        if alpha.getextrema()[0] == 255:
+            # Fully opaque - no need to composite over a background
+            img = img.convert('RGB')
+        else:
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=alpha)
+            img = background
     elif img.mode != 'RGB':
         img = img.convert('RGB')
     
@@ -384,6 +746,10 @@ def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
     img_ratio = img.width / img.height
     target_ratio = target_width / target_height
     
+    # Already card-shaped (the usual case) - nothing to crop
+    if abs(img_ratio - target_ratio) < 1e-3:
+        return img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+    
     if img_ratio > target_ratio:
         # Image is wider than target
         new_height = target_height
@@ -403,8 +769,9 @@ def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
     return img
 
 
-def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str, dpi: int = DEFAULT_DPI):
-    """Create PDF with cards arranged in a grid."""
+@lru_cache(maxsize=None)
+def _page_layout() -> Tuple[float, float, Tuple[Tuple[float, float], ...]]:
+    """Card size in points and the (x, y) of every grid slot on a page."""
     page_width, page_height = LETTER
     
     # Calculate card dimensions in points (72 points per inch)
@@ -417,568 +784,100 @@ def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str, dpi: int
     margin_x = (page_width - grid_width) / 2
     margin_y = (page_height - grid_height) / 2
     
-    c = canvas.Canvas(output_path, pagesize=LETTER)
-    
-    card_index = 0
-    total_cards = len(cards)
-    
-    while card_index < total_cards:
-        # Draw cards for this page
-        for row in range(CARDS_PER_COL):
-            for col in range(CARDS_PER_ROW):
-                if card_index >= total_cards:
-                    break
-                
-                card_name, card_img = cards[card_index]
-                
-                # Calculate position (bottom-left origin in PDF)
-                x = margin_x + col * card_width_pts
-                y = page_height - margin_y - (row + 1) * card_height_pts
-                
-                # Save image temporarily for PDF embedding
-                temp_path = CACHE_DIR / f"temp_{card_index}.jpg"
-                card_img.save(temp_path, "JPEG", quality=95)
-                
-                c.drawImage(str(temp_path), x, y, 
-                           width=card_width_pts, height=card_height_pts)
-                
-                # Clean up temp file
-                temp_path.unlink()
-                
-                card_index += 1
-        
-        # Add new page if more cards remain
-        if card_index < total_cards:
-            c.showPage()
-    
-    c.save()
+    # Slot positions, left to right then top to bottom (bottom-left origin in PDF)
+    slots = tuple(
+        (margin_x + col * card_width_pts, page_height - margin_y - (row + 1) * card_height_pts)
+        for row in range(CARDS_PER_COL)
+        for col in range(CARDS_PER_ROW)
+    )
+    return card_width_pts, card_height_pts, slots
 
 
-def load_decklist(filepath: str) -> List[Tuple[str, int]]:
-    """Load card list from file."""
-    cards = []
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                identifier, qty = parse_card_entry(line)
-                if identifier:
-                    cards.append((identifier, qty))
-    except FileNotFoundError:
-        print(f"Error: File not found: {filepath}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        sys.exit(1)
+def _jpeg_image_reader(card_img: Image.Image) -> ImageReader:
+    """Wrap a card image as JPEG data, which ReportLab embeds without re-encoding.
+    
+    Images opened from the resized-image cache are already JPEG files on disk
+    and are used as they are.
+    """
+    if card_img.format == "JPEG" and getattr(card_img, 'filename', None):
+        return ImageReader(card_img.filename)
     
-    return cards
+    buffer = io.BytesIO()
+    card_img.save(buffer, "JPEG", quality=95, optimize=True)
+    buffer.seek(0)
+    return ImageReader(buffer)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Fetch One Piece TCG card images and create printable proxy sheets."
-    )
-    parser.add_argument(
-        'cards', 
-        nargs='*', 
-        help="Card names or IDs (use quotes for multi-word names)"
-    )
-    parser.add_argument(
-        '-f', '--file',
-        help="Read card names/IDs from a text file"
-    )
-    parser.add_argument(
-        '-o', '--output',
-        default='proxies.pdf',
-        help="Output PDF filename (default: proxies.pdf)"
-    )
-    parser.add_argument(
-        '--dpi',
-        type=int,
-        default=DEFAULT_DPI,
-        help=f"Print DPI (default: {DEFAULT_DPI})"
-    )
-    parser.add_argument(
-        '--no-cache',
-        action='store_true',
-        help="Don't use cached images"
-    )
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help="Show detailed source information"
-    )
-    parser.add_argument(
-        '--jp', '--japanese',
-        action='store_true',
-        dest='japanese',
-        help="Use Japanese card images (may have cleaner scans)"
-    )
-    parser.add_argument(
-        '--image-dir',
-        help="Directory containing your own card images (for clean scans without SAMPLE watermark). Images should be named by card ID, e.g., OP01-001.png"
-    )
-    
-    args = parser.parse_args()
-    
-    # Collect card entries
-    card_entries = []
-    
-    if args.file:
-        card_entries.extend(load_decklist(args.file))
-    
-    for card in args.cards:
-        identifier, qty = parse_card_entry(card)
-        if identifier:
-            card_entries.append((identifier, qty))
-    
-    if not card_entries:
-        print("No cards specified. Use --help for usage information.")
-        sys.exit(1)
-    
-    # Setup
-    setup_cache()
-    use_cache = not args.no_cache
-    lang = "JP" if args.japanese else "EN"
+def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str, dpi: int = DEFAULT_DPI):
+    """Create PDF with cards arranged in a grid."""
+    card_width_pts, card_height_pts, slots = _page_layout()
     
-    # Set custom images directory
-    global CUSTOM_IMAGES_DIR
-    if args.image_dir:
-        CUSTOM_IMAGES_DIR = args.image_dir
-        print(f"  Using custom images from: {args.image_dir}")
+    c = canvas.Canvas(output_path, pagesize=LETTER)
     
-    # Process cards
-    print(f"Processing {sum(qty for _, qty in card_entries)} cards...")
-    if args.japanese:
-        print("  Using Japanese card images")
-    processed_cards = []
+    # Encode each unique image once - quantity copies share the same PIL object
+    readers = {}
     
-    for identifier, quantity in card_entries:
-        print(f"  Fetching: {identifier} (x{quantity})")
-        
-        # Rate limiting
-        time.sleep(0.2)
-        
-        card_data = fetch_card_data(identifier, verbose=args.verbose, lang=lang)
-        if not card_data:
-            continue
+    for card_index, (card_name, card_img) in enumerate(cards):
+        x, y = slots[card_index % CARDS_PER_PAGE]
         
-        actual_name = card_data.get('name', identifier)
+        reader = readers.get(id(card_img))
+        if reader is None:
+            reader = readers[id(card_img)] = _jpeg_image_reader(card_img)
         
-        # Check if we have a local image
-        if 'local_path' in card_data:
-            image_path = Path(card_data['local_path'])
-        else:
-            image_url = get_image_url(card_data)
-            
-            if not image_url:
-                print(f"  âš  No image available for: {actual_name}")
-                continue
-            
-            image_path = download_image(image_url, actual_name, use_cache)
-            if not image_path:
-                continue
-        
-        # Resize and add to list (repeated for quantity)
-        resized_img = resize_card_image(image_path, args.dpi)
-        for _ in range(quantity):
-            processed_cards.append((actual_name, resized_img))
-        
-        print(f"  âœ“ {actual_name}")
-    
-    if not processed_cards:
-        print("No cards were successfully processed.")
-        sys.exit(1)
-    
-    # Generate PDF
-    print(f"\nGenerating PDF: {args.output}")
-    create_pdf(processed_cards, args.output, args.dpi)
-    
-    pages = (len(processed_cards) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
-    print(f"âœ“ Created {args.output} with {len(processed_cards)} cards on {pages} page(s)")
-    print(f"  Print at 100% scale, no margins, for correct card size.")
-
-
-if __name__ == "__main__":
-    main()
-, entry, re.IGNORECASE)
-    if match:
-        quantity = int(match.group(1))
-        identifier = match.group(2).strip()
-    else:
-        quantity = 1
-        identifier = entry
-    
-    return identifier, quantity
-
-
-def is_card_id(identifier: str) -> bool:
-    """Check if identifier looks like a card ID (e.g., OP01-001, ST01-012)."""
-    return bool(re.match(r'^[A-Z]{2,3}\d{2}-\d{3}[A-Z]?$', identifier.upper()))
-
-
-def search_card_tcgplayer(identifier: str) -> Optional[dict]:
-    """Search for card on TCGPlayer."""
-    try:
-        search_term = quote(f"One Piece {identifier}")
-        search_url = f"https://www.tcgplayer.com/search/one-piece-card-game/product?q={search_term}"
-        
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            # Look for product image
-            img = soup.select_one('img.product-image__image, img[data-testid="product-image"]')
-            if img:
-                img_src = img.get('src', '')
-                if img_src and 'tcgplayer' in img_src:
-                    return {'name': identifier, 'image_url': img_src}
-        return None
-    except Exception:
-        return None
-
-
-def search_card_official(identifier: str) -> Optional[dict]:
-    """Search on official One Piece card game site."""
-    try:
-        # The official site uses this card search structure
-        card_id = identifier.upper() if is_card_id(identifier) else None
+        c.drawImage(reader, x, y, 
+                   width=card_width_pts, height=card_height_pts,
+                   preserveAspectRatio=True)
         
-        if card_id:
-            # Direct card page URL pattern
-            search_url = f"https://en.onepiece-cardgame.com/cardlist/?series={card_id[:4]}"
-        else:
-            search_url = f"https://en.onepiece-cardgame.com/cardlist/?freewords={quote(identifier)}"
-        
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for card images on the page
-            cards = soup.select('div.resultCol a img, .cardImg img, img[data-src*="card"]')
-            for card in cards:
-                img_src = card.get('data-src') or card.get('src', '')
-                # Check if this matches our card ID
-                if card_id and card_id.lower() in img_src.lower():
-                    full_url = img_src if img_src.startswith('http') else f"https://en.onepiece-cardgame.com{img_src}"
-                    return {'name': identifier, 'image_url': full_url}
-                elif not card_id and img_src:
-                    full_url = img_src if img_src.startswith('http') else f"https://en.onepiece-cardgame.com{img_src}"
-                    return {'name': identifier, 'image_url': full_url}
-        return None
-    except Exception:
-        return None
-
-
-def search_card_onepiecetopdecks(identifier: str) -> Optional[dict]:
-    """Search using One Piece Top Decks database."""
-    try:
-        # This site has a good card database
-        if is_card_id(identifier):
-            # Format: OP01-001 -> search directly
-            search_url = f"https://onepiecetopdecks.com/card/{identifier.upper()}/"
-        else:
-            search_url = f"https://onepiecetopdecks.com/?s={quote(identifier)}&post_type=card"
-        
-        response = requests.get(search_url, headers=HEADERS, timeout=15, allow_redirects=True)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for card images
-            img = soup.select_one('img.card-image, .card-img img, article img[src*="card"], .wp-post-image')
-            if img:
-                img_src = img.get('data-src') or img.get('src', '')
-                if img_src and ('card' in img_src.lower() or 'op' in img_src.lower() or 'st' in img_src.lower()):
-                    return {'name': identifier, 'image_url': img_src}
-        return None
-    except Exception:
-        return None
-
-
-def search_card_limitless(identifier: str) -> Optional[dict]:
-    """Search using Limitless TCG."""
-    try:
-        search_url = f"https://onepiece.limitlesstcg.com/cards/{identifier.upper()}" if is_card_id(identifier) else f"https://onepiece.limitlesstcg.com/cards?q={quote(identifier)}"
-        
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for card image
-            img = soup.select_one('img.card, .card-image img, img[src*="/cards/"]')
-            if img:
-                img_src = img.get('src', '')
-                if img_src:
-                    full_url = img_src if img_src.startswith('http') else f"https://onepiece.limitlesstcg.com{img_src}"
-                    return {'name': identifier, 'image_url': full_url}
-        return None
-    except Exception:
-        return None
-
-
-def search_card_direct_cdn(identifier: str) -> Optional[dict]:
-    """Try direct CDN URLs for clean card images (no watermarks)."""
-    if not is_card_id(identifier):
-        return None
-    
-    card_id = identifier.upper()
-    # Extract set code (e.g., OP01 from OP01-001)
-    set_code = card_id.split('-')[0] if '-' in card_id else card_id[:4]
+        # Start a new page once this one is full and more cards remain
+        if (card_index + 1) % CARDS_PER_PAGE == 0 and card_index + 1 < len(cards):
+            c.showPage()
     
-    return {'name': identifier, 'card_id': card_id, 'set_code': set_code}
+    c.save()
 
 
-def search_card_limitless_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
-    """Get card from Limitless TCG CDN - high quality scans."""
-    if not is_card_id(identifier):
-        return None
-    
-    card_id = identifier.upper()
-    set_code = card_id.split('-')[0] if '-' in card_id else card_id[:4]
-    
-    # Limitless CDN pattern: /one-piece/OP01/OP01-001_EN.webp
-    url = f"https://limitlesstcg.nyc3.digitaloceanspaces.com/one-piece/{set_code}/{card_id}_{lang}.webp"
+def fetch_and_download(identifier: str, lang: str = "EN",
+                       use_cache: bool = True) -> Optional[Tuple[str, Path, str]]:
+    """Resolve a card and make sure its image is on disk.
     
-    try:
-        response = requests.head(url, headers=HEADERS, timeout=5)
-        if response.status_code == 200:
-            return {'name': identifier, 'image_url': url}
-    except Exception:
-        pass
-    
-    return None
-
-
-def search_card_direct_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
-    """Try direct CDN URLs for card images.
-    Note: Official Bandai CDN images have SAMPLE watermarks."""
-    if not is_card_id(identifier):
+    Returns (card name, image path, source description), or None if the card
+    could not be fetched. Safe to run from worker threads.
+    """
+    card_data = fetch_card_data(identifier, lang=lang)
+    if not card_data:
         return None
     
-    card_id = identifier.upper()
+    actual_name = card_data.get('name', identifier)
     
-    # These sources may have SAMPLE watermarks but are fallbacks
-    if lang == "JP":
-        cdn_urls = [
-            f"https://www.onepiece-cardgame.com/images/cardlist/card/{card_id}.png",
-        ]
-    else:
-        cdn_urls = [
-            f"https://en.onepiece-cardgame.com/images/cardlist/card/{card_id}.png",
-        ]
-    
-    for url in cdn_urls:
-        try:
-            response = requests.head(url, headers=HEADERS, timeout=5)
-            if response.status_code == 200:
-                return {'name': identifier, 'image_url': url}
-        except Exception:
-            continue
+    # Check if we have a local image
+    if 'local_path' in card_data:
+        return actual_name, Path(card_data['local_path']), describe_source(card_data, lang)
     
-    return None
-
-
-def search_card_opcgdb(identifier: str) -> Optional[dict]:
-    """Search using opcgdb.com - community database with clean images."""
-    try:
-        card_id = identifier.upper() if is_card_id(identifier) else identifier
-        search_url = f"https://opcgdb.com/cards/{card_id}"
-        
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for the main card image
-            img = soup.select_one('img.card-image, .card img, img[alt*="card"], img[src*="/cards/"]')
-            if img:
-                img_src = img.get('src', '') or img.get('data-src', '')
-                if img_src:
-                    full_url = img_src if img_src.startswith('http') else f"https://opcgdb.com{img_src}"
-                    return {'name': identifier, 'image_url': full_url}
+    image_url = get_image_url(card_data)
+    if not image_url:
+        print(f"  âš  No image available for: {actual_name}")
         return None
-    except Exception:
-        return None
-
-
-def fetch_card_data(identifier: str, verbose: bool = False, lang: str = "EN") -> Optional[dict]:
-    """Fetch card data from available sources.
-    
-    Source priority:
-    1. Local images (user-provided clean scans) - via --image-dir
-    2. Limitless CDN - actual card scans
-    3. Other community sources
-    4. Official CDN (has SAMPLE watermark)
-    """
-    # Check for local image first
-    local_path = find_local_image(identifier)
-    if local_path:
-        if verbose:
-            print(f"    Source: Local image ({local_path.name})")
-        return {'name': identifier, 'local_path': str(local_path), 'source': 'Local'}
-    
-    # Try Limitless CDN - these are actual card scans
-    card = search_card_limitless_cdn(identifier, lang)
-    if card and card.get('image_url'):
-        card['source'] = "Limitless CDN"
-        if verbose:
-            print(f"    Source: Limitless CDN ({lang})")
-        return card
     
-    # Fallback sources (may have watermarks)
-    fallback_sources = [
-        ("OPCGDB", lambda x: search_card_opcgdb(x)),
-        ("Limitless Site", lambda x: search_card_limitless(x)),
-        ("Top Decks", lambda x: search_card_onepiecetopdecks(x)),
-        ("Official Site", lambda x: search_card_official(x)),
-        ("Official CDN", lambda x: search_card_direct_cdn(x, lang)),
-        ("TCGPlayer", lambda x: search_card_tcgplayer(x)),
-    ]
-    
-    for source_name, search_func in fallback_sources:
-        card = search_func(identifier)
-        if card and card.get('image_url'):
-            card['source'] = source_name
-            if verbose:
-                print(f"    Source: {source_name} (may have SAMPLE watermark)")
-            return card
-    
-    print(f"  âš  Card not found: {identifier}")
-    return None
-
-
-def get_image_url(card_data: dict) -> Optional[str]:
-    """Extract image URL from card data."""
-    # Check various possible fields
-    for field in ['image_url', 'imageUrl', 'image', 'img', 'picture']:
-        if field in card_data and card_data[field]:
-            url = card_data[field]
-            # Ensure it's a full URL
-            if not url.startswith('http'):
-                url = f"https:{url}" if url.startswith('//') else url
-            return url
-    return None
-
-
-def download_image(url: str, card_name: str, use_cache: bool = True) -> Optional[Path]:
-    """Download card image and return local path."""
-    filename = sanitize_filename(card_name) + ".png"
-    cache_path = CACHE_DIR / filename
-    
-    # Check cache first
-    if use_cache and cache_path.exists():
-        return cache_path
-    
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        
-        with open(cache_path, 'wb') as f:
-            f.write(response.content)
-        
-        return cache_path
-    except requests.exceptions.RequestException as e:
-        print(f"  âš  Failed to download image for '{card_name}': {e}")
+    image_path = download_image(image_url, actual_name, use_cache)
+    if not image_path and card_data.get('cached'):
+        # The URL remembered from an earlier run stopped working - forget it
+        # and look the card up again
+        key = url_cache_key(identifier, lang)
+        forget_url_cache(key)
+        card_data = search_remote_sources(identifier, lang=lang)
+        if card_data:
+            store_url_cache(key, card_data)
+            image_path = download_image(get_image_url(card_data), actual_name, use_cache)
+    if not image_path:
         return None
-
-
-def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
-    """Resize card image to standard TCG dimensions at specified DPI."""
-    target_width = int(CARD_WIDTH_INCHES * dpi)
-    target_height = int(CARD_HEIGHT_INCHES * dpi)
-    
-    img = Image.open(image_path)
-    
-    # Convert to RGB if necessary (for PNG with transparency)
-    if img.mode in ('RGBA', 'P'):
-        background = Image.new('RGB', img.size, (255, 255, 255))
-        if img.mode == 'P':
-            img = img.convert('RGBA')
-        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-        img = background
-    elif img.mode != 'RGB':
-        img = img.convert('RGB')
-    
-    # Resize maintaining aspect ratio, then crop/pad to exact size
-    img_ratio = img.width / img.height
-    target_ratio = target_width / target_height
-    
-    if img_ratio > target_ratio:
-        # Image is wider than target
-        new_height = target_height
-        new_width = int(new_height * img_ratio)
-    else:
-        # Image is taller than target
-        new_width = target_width
-        new_height = int(new_width / img_ratio)
     
-    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-    
-    # Center crop to exact dimensions
-    left = (new_width - target_width) // 2
-    top = (new_height - target_height) // 2
-    img = img.crop((left, top, left + target_width, top + target_height))
-    
-    return img
-
-
-def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str, dpi: int = DEFAULT_DPI):
-    """Create PDF with cards arranged in a grid."""
-    page_width, page_height = LETTER
-    
-    # Calculate card dimensions in points (72 points per inch)
-    card_width_pts = CARD_WIDTH_INCHES * 72
-    card_height_pts = CARD_HEIGHT_INCHES * 72
-    
-    # Calculate margins to center the grid
-    grid_width = CARDS_PER_ROW * card_width_pts
-    grid_height = CARDS_PER_COL * card_height_pts
-    margin_x = (page_width - grid_width) / 2
-    margin_y = (page_height - grid_height) / 2
-    
-    c = canvas.Canvas(output_path, pagesize=LETTER)
-    
-    card_index = 0
-    total_cards = len(cards)
-    
-    while card_index < total_cards:
-        # Draw cards for this page
-        for row in range(CARDS_PER_COL):
-            for col in range(CARDS_PER_ROW):
-                if card_index >= total_cards:
-                    break
-                
-                card_name, card_img = cards[card_index]
-                
-                # Calculate position (bottom-left origin in PDF)
-                x = margin_x + col * card_width_pts
-                y = page_height - margin_y - (row + 1) * card_height_pts
-                
-                # Save image temporarily for PDF embedding
-                temp_path = CACHE_DIR / f"temp_{card_index}.jpg"
-                card_img.save(temp_path, "JPEG", quality=95)
-                
-                c.drawImage(str(temp_path), x, y, 
-                           width=card_width_pts, height=card_height_pts)
-                
-                # Clean up temp file
-                temp_path.unlink()
-                
-                card_index += 1
-        
-        # Add new page if more cards remain
-        if card_index < total_cards:
-            c.showPage()
-    
-    c.save()
+    return actual_name, image_path, describe_source(card_data, lang)
 
 
 def load_decklist(filepath: str) -> List[Tuple[str, int]]:
     """Load card list from file."""
-    cards = []
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                identifier, qty = parse_card_entry(line)
-                if identifier:
-                    cards.append((identifier, qty))
+            lines = f.read().splitlines()
     except FileNotFoundError:
         print(f"Error: File not found: {filepath}")
         sys.exit(1)
@@ -986,7 +885,7 @@ def load_decklist(filepath: str) -> List[Tuple[str, int]]:
         print(f"Error reading file: {e}")
         sys.exit(1)
     
-    return cards
+    return [(identifier, qty) for identifier, qty in map(parse_card_entry, lines) if identifier]
 
 
 def main():
@@ -1054,6 +953,8 @@ def main():
     # Setup
     setup_cache()
     use_cache = not args.no_cache
+    if use_cache:
+        load_url_cache()
     lang = "JP" if args.japanese else "EN"
     
     # Set custom images directory
@@ -1062,56 +963,59 @@ def main():
         CUSTOM_IMAGES_DIR = args.image_dir
         print(f"  Using custom images from: {args.image_dir}")
     
-    # Process cards
-    print(f"Processing {sum(qty for _, qty in card_entries)} cards...")
-    if args.japanese:
-        print("  Using Japanese card images")
-    processed_cards = []
-    
-    for identifier, quantity in card_entries:
-        print(f"  Fetching: {identifier} (x{quantity})")
-        
-        # Rate limiting
-        time.sleep(0.2)
-        
-        card_data = fetch_card_data(identifier, verbose=args.verbose, lang=lang)
-        if not card_data:
-            continue
-        
-        actual_name = card_data.get('name', identifier)
+    try:
+        # Process cards
+        print(f"Processing {sum(qty for _, qty in card_entries)} cards...")
+        if args.japanese:
+            print("  Using Japanese card images")
+        processed_cards = []
+    
+        # Merge repeated entries so each card is only fetched once. IDs are
+        # fetched in their normalized form, names by their first spelling.
+        unique_cards = Counter()
+        spellings = {}
+        for identifier, quantity in card_entries:
+            key = card_key(identifier)
+            identifier = spellings.setdefault(key, key if is_card_id(identifier) else identifier)
+            unique_cards[identifier] += quantity
         
-        # Check if we have a local image
-        if 'local_path' in card_data:
-            image_path = Path(card_data['local_path'])
-        else:
-            image_url = get_image_url(card_data)
+        # Fetch in parallel, then resize in order on the main thread
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {}
+            for identifier, quantity in unique_cards.items():
+                print(f"  Fetching: {identifier} (x{quantity})")
+                futures[identifier] = executor.submit(
+                    fetch_and_download, identifier, lang, use_cache)
             
-            if not image_url:
-                print(f"  âš  No image available for: {actual_name}")
-                continue
-            
-            image_path = download_image(image_url, actual_name, use_cache)
-            if not image_path:
-                continue
-        
-        # Resize and add to list (repeated for quantity)
-        resized_img = resize_card_image(image_path, args.dpi)
-        for _ in range(quantity):
-            processed_cards.append((actual_name, resized_img))
-        
-        print(f"  âœ“ {actual_name}")
-    
-    if not processed_cards:
-        print("No cards were successfully processed.")
-        sys.exit(1)
-    
-    # Generate PDF
-    print(f"\nGenerating PDF: {args.output}")
-    create_pdf(processed_cards, args.output, args.dpi)
-    
-    pages = (len(processed_cards) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
-    print(f"âœ“ Created {args.output} with {len(processed_cards)} cards on {pages} page(s)")
-    print(f"  Print at 100% scale, no margins, for correct card size.")
+            for identifier, quantity in unique_cards.items():
+                result = futures[identifier].result()
+                if not result:
+                    continue
+                actual_name, image_path, source = result
+                
+                # Resize and add to list (repeated for quantity)
+                resized_img = resize_card_image(image_path, args.dpi, use_cache)
+                for _ in range(quantity):
+                    processed_cards.append((actual_name, resized_img))
+                
+                print(f"  âœ“ {actual_name}")
+                # Printed here rather than by the workers so it stays next to its card
+                if args.verbose:
+                    print(f"    Source: {source}")
+    
+        if not processed_cards:
+            print("No cards were successfully processed.")
+            sys.exit(1)
+    
+        # Generate PDF
+        print(f"\nGenerating PDF: {args.output}")
+        create_pdf(processed_cards, args.output, args.dpi)
+    
+        pages = (len(processed_cards) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
+        print(f"âœ“ Created {args.output} with {len(processed_cards)} cards on {pages} page(s)")
+        print(f"  Print at 100% scale, no margins, for correct card size.")
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":
@@ -3,19 +3,31 @@
 One Piece TCG Proxy Printer GUI - Visual interface for creating proxy card sheets.
 """
 
+import atexit
+import hashlib
+import html
+import json
 import os
+import queue
 import re
 import sys
 import time
 import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Tuple, Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 from io import BytesIO
 
 import requests
-from bs4 import BeautifulSoup
-from PIL import Image, ImageTk
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import PIL
+from PIL import Image, features
 from reportlab.lib.pagesizes import LETTER
 from reportlab.pdfgen import canvas
 
@@ -30,9 +42,18 @@ CARDS_PER_ROW = 3
 CARDS_PER_COL = 3
 CARDS_PER_PAGE = CARDS_PER_ROW * CARDS_PER_COL
 
+# Number of cards fetched in parallel
+FETCH_WORKERS = 16
+# Fallback source lookups in flight across all cards
+SOURCE_WORKERS = 16
+# Requests in flight to any one host, across all workers
+HOST_CONCURRENCY = 5
+
 # Preview sizing
 PREVIEW_CARD_WIDTH = 120
 PREVIEW_CARD_HEIGHT = int(PREVIEW_CARD_WIDTH * (CARD_HEIGHT_INCHES / CARD_WIDTH_INCHES))
+PREVIEW_DRAIN_MS = 50     # How often queued preview tiles are added to the canvas
+PREVIEW_BATCH_SIZE = 16   # Max tiles added per drain
 
 # Cache / base directory - works both as script and frozen exe
 if getattr(sys, 'frozen', False):
@@ -40,6 +61,17 @@ if getattr(sys, 'frozen', False):
 else:
     BASE_DIR = Path(__file__).parent
 CACHE_DIR = BASE_DIR / "cache"
+RESIZED_DIR = CACHE_DIR / "resized"  # Print-size images, keyed by source and DPI
+
+# Card lookups (identifier -> image URL) remembered across sessions
+LOOKUP_CACHE_PATH = CACHE_DIR / "lookup.json"
+LOOKUP_TTL = 24 * 60 * 60  # Found cards
+LOOKUP_MISS_TTL = 10 * 60  # Cards no source had; kept in memory only
+
+# Decklist / filename patterns
+_RE_SANITIZE = re.compile(r'[<>:"/\\|?*]')
+_RE_CARD_ID = re.compile(r'^[A-Z]{2,3}\d{2}-\d{3}[A-Z]?$')
+_RE_QTY = re.compile(r'^(\d+)x?\s*(.+)$', re.IGNORECASE)
 
 # Request headers
 HEADERS = {
@@ -49,8 +81,47 @@ HEADERS = {
     'Accept-Language': 'en-US,en;q=0.5',
 }
 
+# Shared HTTP session - reuses connections to the same hosts across cards
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])))
+
+# Only build <img> tags when a page's selectors match nothing else. Selectors
+# that go through a parent element (e.g. '.card img') need the full tree.
+IMG_STRAINER = SoupStrainer('img')
+
+# Card image URLs pulled straight from raw page bytes. Only URLs naming the
+# requested card ID are accepted (pages also show related cards); otherwise
+# the BeautifulSoup selectors run as before
+_CARDS_IMG_RE = re.compile(rb'<img\b[^>]*?\bsrc="([^"]*/cards/[^"]+)"')  # OPCGDB, Limitless
+_TOPDECKS_IMG_RE = re.compile(rb'<img\b[^>]*?\bclass="[^"]*\bwp-post-image\b[^>]*>')
+_OFFICIAL_IMG_RE = re.compile(rb'<img\b[^>]*?\bdata-src="([^"]*/cardlist/card/[^"]+)"')
+_IMG_SRC_ATTR_RE = re.compile(rb'\b(data-src|src)="([^"]+)"')
+
+# Selectors compiled once for the BeautifulSoup fallback
+_SEL_OPCGDB = sv.compile('img.card-image, .card img, img[alt*="card"], img[src*="/cards/"]')
+_SEL_LIMITLESS = sv.compile('img.card, .card-image img, img[src*="/cards/"]')
+_SEL_TOPDECKS = sv.compile('img.card-image, .card-img img, article img[src*="card"], .wp-post-image')
+_SEL_OFFICIAL = sv.compile('div.resultCol a img, .cardImg img, img[data-src*="card"]')
+_SEL_TCGPLAYER = sv.compile('img.product-image__image, img[data-testid="product-image"]')
+
 # Custom images directory (set via GUI)
 CUSTOM_IMAGES_DIR = None
+# Upper-cased stem / sanitized name -> image in CUSTOM_IMAGES_DIR
+_LOCAL_INDEX = {}
+
+# "<lang>:<identifier>" -> {'card': dict or None, 'expires': timestamp}
+_LOOKUP_CACHE = {}
+_LOOKUP_LOCK = threading.Lock()
+
+# Shared by every card so nested lookups stay within SOURCE_WORKERS threads
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=SOURCE_WORKERS)
+
+# host -> semaphore gating concurrent requests to it
+_HOST_SEMAPHORES = defaultdict(lambda: threading.Semaphore(HOST_CONCURRENCY))
+_HOST_SEMAPHORES_LOCK = threading.Lock()
 
 
 # ---------------------------------------------------------------------------
@@ -59,69 +130,184 @@ CUSTOM_IMAGES_DIR = None
 
 def setup_cache():
     CACHE_DIR.mkdir(exist_ok=True)
+    RESIZED_DIR.mkdir(exist_ok=True)
+    load_lookup_cache()
+    atexit.register(save_lookup_cache)
+
+
+def load_lookup_cache():
+    try:
+        with open(LOOKUP_CACHE_PATH, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
+    now = time.time()
+    with _LOOKUP_LOCK:
+        for key, entry in entries.items():
+            if entry.get('card') and entry.get('expires', 0) > now:
+                _LOOKUP_CACHE[key] = entry
+
+
+def save_lookup_cache():
+    now = time.time()
+    with _LOOKUP_LOCK:
+        entries = {k: e for k, e in _LOOKUP_CACHE.items() if e['card'] and e['expires'] > now}
+    try:
+        tmp = LOOKUP_CACHE_PATH.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        tmp.replace(LOOKUP_CACHE_PATH)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _host_slot(url: str):
+    """Hold one of the URL host's request slots for the duration of the block."""
+    with _HOST_SEMAPHORES_LOCK:
+        sem = _HOST_SEMAPHORES[urlparse(url).netloc]
+    with sem:
+        yield
+
+
+def _http_get(url: str, **kwargs) -> requests.Response:
+    with _host_slot(url):
+        return SESSION.get(url, **kwargs)
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '_', name.lower().replace(' ', '_'))
+    return _RE_SANITIZE.sub('_', name.lower().replace(' ', '_'))
+
+
+def _build_local_index(dir_path: Optional[str]):
+    """Scan the custom images folder once so lookups don't glob it per card."""
+    global _LOCAL_INDEX
+    index = {}
+    img_dir = Path(dir_path) if dir_path else None
+    if img_dir and img_dir.is_dir():
+        for p in sorted(img_dir.iterdir()):
+            if p.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp') and p.is_file():
+                index.setdefault(p.stem.upper(), p)
+                index.setdefault(sanitize_filename(p.stem), p)
+    _LOCAL_INDEX = index  # Swapped whole so worker threads never see a partial index
 
 
 def find_local_image(identifier: str) -> Optional[Path]:
-    if not CUSTOM_IMAGES_DIR:
-        return None
-    img_dir = Path(CUSTOM_IMAGES_DIR)
-    if not img_dir.exists():
-        return None
-    card_id = identifier.upper()
-    for pattern in [f"{card_id}.*", f"{card_id.lower()}.*", f"{sanitize_filename(identifier)}.*"]:
-        for match in img_dir.glob(pattern):
-            if match.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp'):
-                return match
-    return None
+    return _LOCAL_INDEX.get(identifier.upper()) or _LOCAL_INDEX.get(sanitize_filename(identifier))
 
 
 def is_card_id(identifier: str) -> bool:
-    return bool(re.match(r'^[A-Z]{2,3}\d{2}-\d{3}[A-Z]?$', identifier.upper()))
+    return bool(_RE_CARD_ID.match(identifier.upper()))
 
 
 def parse_card_entry(entry: str) -> Tuple[Optional[str], int]:
     entry = entry.strip()
     if not entry or entry.startswith('#'):
         return None, 0
-    match = re.match(r'^(\d+)x?\s*(.+)$', entry, re.IGNORECASE)
+    match = _RE_QTY.match(entry)
     if match:
         return match.group(2).strip(), int(match.group(1))
     return entry, 1
 
 
+def coalesce_entries(entries: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+    """Merge repeated identifiers so each unique card is fetched once, in first-seen order.
+
+    Names are matched on the key their downloaded image is cached under, so two
+    spellings never download into the same file at once; the first spelling is kept.
+    """
+    merged = Counter()
+    spellings = {}
+    for ident, qty in entries:
+        if is_card_id(ident):
+            ident = ident.upper()
+        else:
+            ident = spellings.setdefault(sanitize_filename(ident), ident)
+        merged[ident] += qty
+    return list(merged.items())
+
+
+def save_response(resp: requests.Response, path: Path):
+    """Stream a response body to path; an interrupted write never leaves a partial file."""
+    tmp = path.with_name(path.name + '.part')
+    try:
+        with open(tmp, 'wb') as f:
+            for chunk in resp.iter_content(64 * 1024):
+                f.write(chunk)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 # ---- Sources ---------------------------------------------------------------
 
+def _decode_src(raw: bytes) -> str:
+    return html.unescape(raw.decode('utf-8', 'replace'))
+
+
+def _match_src(pattern: re.Pattern, content: bytes, card_id: Optional[str]) -> str:
+    """First URL captured by pattern that names card_id; '' for name searches."""
+    if not card_id:
+        return ''
+    needle = card_id.lower()
+    for m in pattern.finditer(content):
+        src = _decode_src(m.group(1))
+        if needle in src.lower():
+            return src
+    return ''
+
+
+def _match_topdecks_src(content: bytes, card_id: Optional[str]) -> str:
+    """Like _match_src, for Top Decks' wp-post-image tags (which may lazy-load)."""
+    if not card_id:
+        return ''
+    needle = card_id.lower()
+    for tag in _TOPDECKS_IMG_RE.finditer(content):
+        # data-src (lazy loading) comes first when a tag has both
+        attrs = dict(_IMG_SRC_ATTR_RE.findall(tag.group(0)))
+        raw = attrs.get(b'data-src') or attrs.get(b'src')
+        src = _decode_src(raw) if raw else ''
+        if needle in src.lower():
+            return src
+    return ''
+
+
+def fetch_cdn_image(identifier: str, url: str, cache_path: Path, source: str) -> Optional[dict]:
+    """GET a predictable CDN image straight into the cache (no separate HEAD probe)."""
+    if cache_path.exists():
+        return {'name': identifier, 'local_path': str(cache_path), 'source': f"{source} (cached)"}
+    try:
+        with _host_slot(url), SESSION.get(url, timeout=5, stream=True) as resp:
+            if resp.status_code == 200 and resp.headers.get('Content-Type', '').startswith('image/'):
+                save_response(resp, cache_path)
+                return {'name': identifier, 'local_path': str(cache_path), 'source': source}
+    except Exception:
+        pass
+    return None
+
+
 def search_card_limitless_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
     if not is_card_id(identifier):
         return None
     card_id = identifier.upper()
     set_code = card_id.split('-')[0]
     url = f"https://limitlesstcg.nyc3.digitaloceanspaces.com/one-piece/{set_code}/{card_id}_{lang}.webp"
-    try:
-        resp = requests.head(url, headers=HEADERS, timeout=5)
-        if resp.status_code == 200:
-            return {'name': identifier, 'image_url': url, 'source': 'Limitless CDN'}
-    except Exception:
-        pass
-    return None
+    return fetch_cdn_image(identifier, url, CACHE_DIR / f"{card_id}_{lang}.webp", 'Limitless CDN')
 
 
 def search_card_opcgdb(identifier: str) -> Optional[dict]:
     try:
-        card_id = identifier.upper() if is_card_id(identifier) else identifier
-        resp = requests.get(f"https://opcgdb.com/cards/{card_id}", headers=HEADERS, timeout=15)
+        card_id = identifier.upper() if is_card_id(identifier) else None
+        resp = _http_get(f"https://opcgdb.com/cards/{card_id or identifier}", timeout=15)
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            img = soup.select_one('img.card-image, .card img, img[alt*="card"], img[src*="/cards/"]')
-            if img:
-                src = img.get('src', '') or img.get('data-src', '')
-                if src:
-                    full = src if src.startswith('http') else f"https://opcgdb.com{src}"
-                    return {'name': identifier, 'image_url': full, 'source': 'OPCGDB'}
+            src = _match_src(_CARDS_IMG_RE, resp.content, card_id)
+            if not src:
+                soup = BeautifulSoup(resp.content, 'lxml')
+                img = _SEL_OPCGDB.select_one(soup)
+                src = (img.get('src', '') or img.get('data-src', '')) if img else ''
+            if src:
+                full = src if src.startswith('http') else f"https://opcgdb.com{src}"
+                return {'name': identifier, 'image_url': full, 'source': 'OPCGDB'}
     except Exception:
         pass
     return None
@@ -129,18 +315,20 @@ def search_card_opcgdb(identifier: str) -> Optional[dict]:
 
 def search_card_limitless(identifier: str) -> Optional[dict]:
     try:
-        url = (f"https://onepiece.limitlesstcg.com/cards/{identifier.upper()}"
-               if is_card_id(identifier)
+        card_id = identifier.upper() if is_card_id(identifier) else None
+        url = (f"https://onepiece.limitlesstcg.com/cards/{card_id}"
+               if card_id
                else f"https://onepiece.limitlesstcg.com/cards?q={quote(identifier)}")
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _http_get(url, timeout=15)
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            img = soup.select_one('img.card, .card-image img, img[src*="/cards/"]')
-            if img:
-                src = img.get('src', '')
-                if src:
-                    full = src if src.startswith('http') else f"https://onepiece.limitlesstcg.com{src}"
-                    return {'name': identifier, 'image_url': full, 'source': 'Limitless'}
+            src = _match_src(_CARDS_IMG_RE, resp.content, card_id)
+            if not src:
+                soup = BeautifulSoup(resp.content, 'lxml')
+                img = _SEL_LIMITLESS.select_one(soup)
+                src = img.get('src', '') if img else ''
+            if src:
+                full = src if src.startswith('http') else f"https://onepiece.limitlesstcg.com{src}"
+                return {'name': identifier, 'image_url': full, 'source': 'Limitless'}
     except Exception:
         pass
     return None
@@ -148,17 +336,19 @@ def search_card_limitless(identifier: str) -> Optional[dict]:
 
 def search_card_onepiecetopdecks(identifier: str) -> Optional[dict]:
     try:
-        url = (f"https://onepiecetopdecks.com/card/{identifier.upper()}/"
-               if is_card_id(identifier)
+        card_id = identifier.upper() if is_card_id(identifier) else None
+        url = (f"https://onepiecetopdecks.com/card/{card_id}/"
+               if card_id
                else f"https://onepiecetopdecks.com/?s={quote(identifier)}&post_type=card")
-        resp = requests.get(url, headers=HEADERS, timeout=15, allow_redirects=True)
+        resp = _http_get(url, timeout=15, allow_redirects=True)
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            img = soup.select_one('img.card-image, .card-img img, article img[src*="card"], .wp-post-image')
-            if img:
-                src = img.get('data-src') or img.get('src', '')
-                if src and any(k in src.lower() for k in ('card', 'op', 'st')):
-                    return {'name': identifier, 'image_url': src, 'source': 'Top Decks'}
+            src = _match_topdecks_src(resp.content, card_id)
+            if not src:
+                soup = BeautifulSoup(resp.content, 'lxml')
+                img = _SEL_TOPDECKS.select_one(soup)
+                src = (img.get('data-src') or img.get('src', '')) if img else ''
+            if src and any(k in src.lower() for k in ('card', 'op', 'st')):
+                return {'name': identifier, 'image_url': src, 'source': 'Top Decks'}
     except Exception:
         pass
     return None
@@ -170,11 +360,16 @@ def search_card_official(identifier: str) -> Optional[dict]:
         url = (f"https://en.onepiece-cardgame.com/cardlist/?series={card_id[:4]}"
                if card_id
                else f"https://en.onepiece-cardgame.com/cardlist/?freewords={quote(identifier)}")
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _http_get(url, timeout=15)
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            for img in soup.select('div.resultCol a img, .cardImg img, img[data-src*="card"]'):
-                src = img.get('data-src') or img.get('src', '')
+            src = _match_src(_OFFICIAL_IMG_RE, resp.content, card_id)
+            if src:
+                srcs = [src]
+            else:
+                soup = BeautifulSoup(resp.content, 'lxml')
+                srcs = [img.get('data-src') or img.get('src', '')
+                        for img in _SEL_OFFICIAL.select(soup)]
+            for src in srcs:
                 if card_id and card_id.lower() in src.lower():
                     full = src if src.startswith('http') else f"https://en.onepiece-cardgame.com{src}"
                     return {'name': identifier, 'image_url': full, 'source': 'Official'}
@@ -192,56 +387,74 @@ def search_card_direct_cdn(identifier: str, lang: str = "EN") -> Optional[dict]:
     card_id = identifier.upper()
     base = "https://www.onepiece-cardgame.com" if lang == "JP" else "https://en.onepiece-cardgame.com"
     url = f"{base}/images/cardlist/card/{card_id}.png"
-    try:
-        resp = requests.head(url, headers=HEADERS, timeout=5)
-        if resp.status_code == 200:
-            return {'name': identifier, 'image_url': url, 'source': 'Official CDN'}
-    except Exception:
-        pass
-    return None
+    return fetch_cdn_image(identifier, url, CACHE_DIR / f"{card_id}_{lang}_official.png", 'Official CDN')
 
 
 def search_card_tcgplayer(identifier: str) -> Optional[dict]:
     try:
         search_url = f"https://www.tcgplayer.com/search/one-piece-card-game/product?q={quote(f'One Piece {identifier}')}"
-        resp = requests.get(search_url, headers=HEADERS, timeout=15)
+        resp = _http_get(search_url, timeout=15)
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            img = soup.select_one('img.product-image__image, img[data-testid="product-image"]')
-            if img:
-                src = img.get('src', '')
-                if src and 'tcgplayer' in src:
-                    return {'name': identifier, 'image_url': src, 'source': 'TCGPlayer'}
+            soup = BeautifulSoup(resp.content, 'lxml', parse_only=IMG_STRAINER)
+            img = _SEL_TCGPLAYER.select_one(soup)
+            src = img.get('src', '') if img else ''
+            if src and 'tcgplayer' in src:
+                return {'name': identifier, 'image_url': src, 'source': 'TCGPlayer'}
     except Exception:
         pass
     return None
 
 
 def fetch_card_data(identifier: str, lang: str = "EN") -> Optional[dict]:
-    """Fetch card data trying sources in priority order."""
+    """Fetch card data, using local images first and then cached lookups."""
     local = find_local_image(identifier)
     if local:
         return {'name': identifier, 'local_path': str(local), 'source': 'Local'}
 
+    key = f"{lang}:{identifier.upper() if is_card_id(identifier) else identifier}"
+    with _LOOKUP_LOCK:
+        entry = _LOOKUP_CACHE.get(key)
+    if entry and entry['expires'] > time.time():
+        card = entry['card']
+        # Images saved straight into the cache may have been cleared since
+        if not card or 'local_path' not in card or Path(card['local_path']).exists():
+            return dict(card) if card else None
+
+    card = search_card_sources(identifier, lang)
+    ttl = LOOKUP_TTL if card else LOOKUP_MISS_TTL
+    with _LOOKUP_LOCK:
+        _LOOKUP_CACHE[key] = {'card': card, 'expires': time.time() + ttl}
+    return dict(card) if card else None
+
+
+def search_card_sources(identifier: str, lang: str = "EN") -> Optional[dict]:
+    """Search the online sources in priority order."""
     card = search_card_limitless_cdn(identifier, lang)
     if card:
         return card
 
-    for _name, fn in [
-        ("OPCGDB", search_card_opcgdb),
-        ("Limitless", search_card_limitless),
-        ("Top Decks", search_card_onepiecetopdecks),
-        ("Official", search_card_official),
-        ("TCGPlayer", search_card_tcgplayer),
-    ]:
-        card = fn(identifier)
-        if card and card.get('image_url'):
-            return card
-
-    card = search_card_direct_cdn(identifier, lang)
-    if card:
-        return card
-    return None
+    # The fallbacks live on different hosts, so query them all at once and
+    # keep the highest-priority hit
+    futures = [_SOURCE_POOL.submit(fn, identifier) for fn in [
+        search_card_opcgdb,
+        search_card_limitless,
+        search_card_onepiecetopdecks,
+        search_card_official,
+        search_card_tcgplayer,
+    ]]
+    try:
+        for future in futures:
+            card = future.result()
+            if card and card.get('image_url'):
+                return card
+    finally:
+        # Lower-priority lookups that haven't started yet are no longer needed
+        for future in futures:
+            future.cancel()
+
+    # Last resort only: this downloads the full (watermarked) image, which
+    # would be wasted whenever a page lookup above finds the card
+    return search_card_direct_cdn(identifier, lang)
 
 
 def get_image_url(card_data: dict) -> Optional[str]:
@@ -260,16 +473,36 @@ def download_image(url: str, card_name: str, use_cache: bool = True) -> Optional
     if use_cache and cache_path.exists():
         return cache_path
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        with open(cache_path, 'wb') as f:
-            f.write(resp.content)
+        with _host_slot(url), SESSION.get(url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            save_response(resp, cache_path)
         return cache_path
-    except requests.exceptions.RequestException:
+    except (requests.exceptions.RequestException, OSError):
         return None
 
 
-def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
+def image_backend() -> str:
+    """Describe the Pillow build doing the resampling, e.g. 'Pillow-SIMD 9.5.0.post1 + libjpeg-turbo'."""
+    # Pillow-SIMD versions carry a .postN suffix; stock Pillow releases never do
+    name = "Pillow-SIMD" if '.post' in PIL.__version__ else "Pillow"
+    desc = f"{name} {PIL.__version__}"
+    if features.check_feature('libjpeg_turbo'):
+        desc += " + libjpeg-turbo"
+    return desc
+
+
+def resized_cache_path(image_path: Path, dpi: int) -> Path:
+    # The folder hash keeps a custom scan and a downloaded image with the same name apart
+    folder = hashlib.md5(str(image_path.parent.resolve()).encode('utf-8')).hexdigest()[:8]
+    return RESIZED_DIR / f"{sanitize_filename(image_path.stem)}_{folder}_{dpi}.jpg"
+
+
+def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Path:
+    """Resize to card size at dpi and return the JPEG, reusing the result from earlier runs."""
+    out = resized_cache_path(image_path, dpi)
+    if out.exists() and out.stat().st_mtime >= image_path.stat().st_mtime:
+        return out
+
     target_w = int(CARD_WIDTH_INCHES * dpi)
     target_h = int(CARD_HEIGHT_INCHES * dpi)
     img = Image.open(image_path)
@@ -290,10 +523,19 @@ def resize_card_image(image_path: Path, dpi: int = DEFAULT_DPI) -> Image.Image:
     img = img.resize((nw, nh), Image.Resampling.LANCZOS)
     left = (nw - target_w) // 2
     top = (nh - target_h) // 2
-    return img.crop((left, top, left + target_w, top + target_h))
+    img = img.crop((left, top, left + target_w, top + target_h))
+    # q85 is indistinguishable from q95 at print size and about half the bytes.
+    # Saved via a temp name so an interrupted save never leaves a truncated entry
+    tmp = out.with_name(out.name + '.part')
+    try:
+        img.save(tmp, 'JPEG', quality=85, optimize=True, progressive=True)
+        tmp.replace(out)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return out
 
 
-def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str,
+def create_pdf(cards: List[Tuple[str, Path]], output_path: str,
                dpi: int = DEFAULT_DPI):
     pw, ph = LETTER
     cw = CARD_WIDTH_INCHES * 72
@@ -313,10 +555,8 @@ def create_pdf(cards: List[Tuple[str, Image.Image]], output_path: str,
                 name, cimg = cards[idx]
                 x = mx + col * cw
                 y = ph - my - (row + 1) * ch
-                tmp = CACHE_DIR / f"temp_{idx}.jpg"
-                cimg.save(tmp, "JPEG", quality=95)
-                c.drawImage(str(tmp), x, y, width=cw, height=ch)
-                tmp.unlink()
+                # Resized JPEGs are embedded as-is, and repeats share one image object
+                c.drawImage(str(cimg), x, y, width=cw, height=ch)
                 idx += 1
         if idx < total:
             c.showPage()
@@ -334,11 +574,12 @@ class OnePieceProxyGUI:
         self.root.geometry("1200x800")
         self.root.minsize(900, 600)
 
-        self.card_images: List[Tuple[str, Image.Image]] = []
+        self.card_images: List[Tuple[str, Path]] = []  # (name, resized JPEG)
         self.preview_images = []
         self.card_photo_refs = []
         self.use_japanese = tk.BooleanVar(value=False)
         self.custom_image_dir = tk.StringVar(value="")
+        self._preview_q = queue.Queue()  # (thumbnail PPM, label) from worker threads
 
         self.setup_ui()
         setup_cache()
@@ -431,7 +672,8 @@ class OnePieceProxyGUI:
         self.progress_var = tk.DoubleVar()
         ttk.Progressbar(bottom, variable=self.progress_var, maximum=100).pack(fill=tk.X, pady=(0, 5))
 
-        self.status_var = tk.StringVar(value="Ready - Enter your decklist and click 'Fetch Cards'")
+        self.status_var = tk.StringVar(
+            value=f"Ready - Enter your decklist and click 'Fetch Cards' (images: {image_backend()})")
         ttk.Label(bottom, textvariable=self.status_var).pack(anchor=tk.W)
 
         export_row = ttk.Frame(bottom)
@@ -442,6 +684,8 @@ class OnePieceProxyGUI:
         self.count_var = tk.StringVar(value="")
         ttk.Label(export_row, textvariable=self.count_var).pack(side=tk.LEFT)
 
+        self.root.after(PREVIEW_DRAIN_MS, self._drain_previews)
+
     # ---- Canvas helpers ----------------------------------------------------
 
     def _on_frame_cfg(self, _):
@@ -459,6 +703,13 @@ class OnePieceProxyGUI:
         d = filedialog.askdirectory(title="Select Custom Card Images Folder")
         if d:
             self.custom_image_dir.set(d)
+            self._apply_image_dir()
+
+    def _apply_image_dir(self):
+        global CUSTOM_IMAGES_DIR
+        val = self.custom_image_dir.get().strip()
+        CUSTOM_IMAGES_DIR = val if val else None
+        _build_local_index(CUSTOM_IMAGES_DIR)
 
     def load_file(self):
         fp = filedialog.askopenfilename(
@@ -500,7 +751,7 @@ class OnePieceProxyGUI:
     # ---- Fetch -------------------------------------------------------------
 
     def fetch_cards(self):
-        entries = self.parse_decklist()
+        entries = coalesce_entries(self.parse_decklist())
         if not entries:
             messagebox.showwarning("No Cards", "Please enter some cards in the decklist.")
             return
@@ -508,68 +759,81 @@ class OnePieceProxyGUI:
         self.fetch_btn.config(state=tk.DISABLED)
         self.status_var.set("Fetching cards...")
 
-        # Apply custom image dir
-        global CUSTOM_IMAGES_DIR
-        val = self.custom_image_dir.get().strip()
-        CUSTOM_IMAGES_DIR = val if val else None
+        self._apply_image_dir()  # Also picks up typed paths and newly added images
 
         t = threading.Thread(target=self._fetch_thread, args=(entries,), daemon=True)
         t.start()
 
+    def _load_card(self, identifier: str, lang: str):
+        """Fetch, download and resize one card (runs on a worker thread).
+
+        Returns (name, label, pdf_path, preview_ppm) or None if the card failed.
+        """
+        card_data = fetch_card_data(identifier, lang=lang)
+        if not card_data:
+            return None
+
+        actual_name = card_data.get('name', identifier)
+        source = card_data.get('source', '')
+
+        # Resolve image
+        if 'local_path' in card_data:
+            image_path = Path(card_data['local_path'])
+        else:
+            img_url = get_image_url(card_data)
+            if not img_url:
+                return None
+            image_path = download_image(img_url, actual_name)
+            if not image_path:
+                return None
+
+        pdf_path = resize_card_image(image_path)
+        # Thumbnail the small print-size JPEG rather than decoding the source a second
+        # time; draft decodes it at half scale, still 2x the tile for a sharp downsample
+        preview = Image.open(pdf_path)
+        preview.draft('RGB', (PREVIEW_CARD_WIDTH * 2, PREVIEW_CARD_HEIGHT * 2))
+        preview.thumbnail((PREVIEW_CARD_WIDTH, PREVIEW_CARD_HEIGHT), Image.Resampling.LANCZOS)
+        # Encode for Tk here so the Tk thread only wraps ready bytes in a PhotoImage
+        preview = preview.convert('RGB')
+        preview_ppm = b'P6\n%d %d\n255\n' % preview.size + preview.tobytes()
+
+        label = f"{actual_name} [{source}]" if source else actual_name
+        return actual_name, label, pdf_path, preview_ppm
+
     def _fetch_thread(self, entries: List[Tuple[str, int]]):
         total = sum(q for _, q in entries)
         fetched = 0
         errors = []
         lang = "JP" if self.use_japanese.get() else "EN"
 
-        for identifier, quantity in entries:
-            self.root.after(0, lambda n=identifier: self.status_var.set(f"Fetching: {n}..."))
-            time.sleep(0.2)
+        self.root.after(0, lambda: self.status_var.set(f"Fetching {len(entries)} cards..."))
 
-            card_data = fetch_card_data(identifier, lang=lang)
-            if not card_data:
-                errors.append(identifier)
-                fetched += quantity
-                self.root.after(0, lambda f=fetched: self.progress_var.set((f / total) * 100))
-                continue
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = [executor.submit(self._load_card, identifier, lang)
+                       for identifier, _ in entries]
 
-            actual_name = card_data.get('name', identifier)
-            source = card_data.get('source', '')
-
-            # Resolve image
-            if 'local_path' in card_data:
-                image_path = Path(card_data['local_path'])
-            else:
-                img_url = get_image_url(card_data)
-                if not img_url:
-                    errors.append(identifier)
-                    fetched += quantity
-                    self.root.after(0, lambda f=fetched: self.progress_var.set((f / total) * 100))
-                    continue
-                image_path = download_image(img_url, actual_name)
-                if not image_path:
+            # Collect in decklist order so the PDF keeps the deck's layout
+            for (identifier, quantity), future in zip(entries, futures):
+                result = future.result()
+                if not result:
                     errors.append(identifier)
                     fetched += quantity
                     self.root.after(0, lambda f=fetched: self.progress_var.set((f / total) * 100))
                     continue
 
-            pdf_img = resize_card_image(image_path)
-            preview = Image.open(image_path)
-            preview.thumbnail((PREVIEW_CARD_WIDTH, PREVIEW_CARD_HEIGHT), Image.Resampling.LANCZOS)
+                actual_name, label, pdf_path, preview_ppm = result
+                self.root.after(0, lambda n=actual_name: self.status_var.set(f"Fetched: {n}"))
 
-            label = f"{actual_name} [{source}]" if source else actual_name
-
-            for _ in range(quantity):
-                self.card_images.append((actual_name, pdf_img))
-                self.root.after(0, lambda img=preview.copy(), nm=label:
-                               self._add_preview(img, nm))
-                fetched += 1
-                self.root.after(0, lambda f=fetched: self.progress_var.set((f / total) * 100))
+                for _ in range(quantity):
+                    self.card_images.append((actual_name, pdf_path))
+                    self._preview_q.put((preview_ppm, label))
+                    fetched += 1
+                    self.root.after(0, lambda f=fetched: self.progress_var.set((f / total) * 100))
 
         self.root.after(0, lambda: self._fetch_done(total, len(errors), errors))
 
-    def _add_preview(self, pil_img: Image.Image, card_name: str):
-        photo = ImageTk.PhotoImage(pil_img)
+    def _add_preview(self, ppm: bytes, card_name: str):
+        photo = tk.PhotoImage(data=ppm)
         self.card_photo_refs.append(photo)
         n = len(self.card_photo_refs) - 1
         cpr = max(1, (self.preview_canvas.winfo_width() - 20) // (PREVIEW_CARD_WIDTH + 10))
@@ -580,8 +844,21 @@ class OnePieceProxyGUI:
         ttk.Label(fr, image=photo).pack()
         disp = card_name[:22] + "..." if len(card_name) > 22 else card_name
         ttk.Label(fr, text=disp, font=('TkDefaultFont', 8)).pack()
-        self.cards_frame.update_idletasks()
-        self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+
+    def _drain_previews(self):
+        """Add queued preview tiles in batches, relaying out the canvas once per batch."""
+        added = 0
+        try:
+            while added < PREVIEW_BATCH_SIZE:
+                ppm, card_name = self._preview_q.get_nowait()
+                self._add_preview(ppm, card_name)
+                added += 1
+        except queue.Empty:
+            pass
+        if added:
+            self.cards_frame.update_idletasks()
+            self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+        self.root.after(PREVIEW_DRAIN_MS, self._drain_previews)
 
     def _fetch_done(self, total, err_count, errors):
         self.fetch_btn.config(state=tk.NORMAL)